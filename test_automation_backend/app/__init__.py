@@ -0,0 +1,5 @@
+"""Test automation backend application package."""
+
+from .app_factory import create_app
+
+__all__ = ["create_app"]
@@ -0,0 +1,156 @@
+"""Application factory for the test automation backend."""
+
+import functools
+import hashlib
+import json
+from pathlib import Path
+
+from flask import Flask, Response, request
+from flask_cors import CORS
+from flask_smorest import Api
+
+from .config import get_config
+from .errors import register_error_handlers
+from .extensions import db
+from .json_provider import OrjsonProvider
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+INPUT_DIR = BASE_DIR / "input"
+OUTPUT_DIR = BASE_DIR / "output"
+REPORTS_DIR = BASE_DIR / "reports"
+ARTIFACTS_DIR = BASE_DIR / "artifacts"
+
+
+@functools.cache
+def _ensure_dirs(paths):
+    """Create whichever of ``paths`` are missing, once per process.
+
+    The isdir check is cheaper than makedirs' own walk on network
+    filesystems, and the cache means forked/preloaded workers and
+    repeated factory calls don't re-stat anything.
+    """
+    for path in paths:
+        path = Path(path)
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+
+
+def ensure_directories(app):
+    """Create the directories the application writes to."""
+    _ensure_dirs(
+        (
+            app.instance_path,
+            app.config["STORAGE_DIR"],
+            INPUT_DIR,
+            OUTPUT_DIR,
+            REPORTS_DIR,
+            ARTIFACTS_DIR,
+        )
+    )
+
+
+def _cache_openapi_spec(app, api):
+    """Serve /docs/openapi.json from bytes frozen at startup.
+
+    flask-smorest rebuilds the spec dict on every request; once all
+    blueprints are registered the document is immutable, so we serialize
+    it once and answer with cached bytes (plus an ETag so pollers get
+    304s).  Called only outside debug mode so dev reload keeps
+    regenerating the spec, and only when serialization succeeds so a
+    failure is never cached.
+    """
+    try:
+        spec_bytes = json.dumps(api.spec.to_dict(), separators=(",", ":")).encode()
+    except Exception:
+        return
+    spec_etag = hashlib.sha256(spec_bytes).hexdigest()
+
+    def openapi_json():
+        response = Response(spec_bytes, mimetype="application/json")
+        response.set_etag(spec_etag)
+        return response.make_conditional(request)
+
+    app.view_functions["api-docs.openapi_json"] = openapi_json
+
+
+def create_app(config_object=None):
+    """Create and configure the Flask application."""
+    app = Flask(__name__)
+    app.config.from_object(config_object or get_config())
+    app.json = OrjsonProvider(app)
+
+    if not app.config.get("TESTING"):
+        ensure_directories(app)
+    # One CORS middleware with a concrete origin list resolved at
+    # startup; wildcard resource dicts make flask-cors re-match regexes
+    # per request.
+    origins = [o.strip() for o in app.config["FRONTEND_ORIGIN"].split(",")]
+    CORS(app, origins=origins)
+    db.init_app(app)
+
+    # One Storage for the app's lifetime; routes and services grab it
+    # via Storage.instance() / app.extensions instead of re-instantiating
+    # (and re-stating the directory tree) on every request.
+    from .services.storage import Storage
+
+    Storage.init_app(app)
+
+    # Background work goes to Celery when a broker is configured,
+    # otherwise to an in-process pool (tasks run eagerly under TESTING,
+    # so no pool is needed there).
+    from .celery_app import make_celery
+
+    celery = make_celery(app)
+    if celery is not None:
+        app.extensions["celery"] = celery
+    elif not app.config.get("TESTING"):
+        from concurrent.futures import ThreadPoolExecutor
+
+        app.extensions["task_pool"] = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="task"
+        )
+
+    if not app.config.get("TESTING"):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Dedicated pool for pytest runs so long executions never starve
+        # the lighter generation tasks.
+        app.extensions["run_pool"] = ThreadPoolExecutor(
+            max_workers=app.config["RUN_POOL_WORKERS"], thread_name_prefix="run"
+        )
+
+    api = Api(app)
+
+    # Blueprints are imported here, not at module load, so CLI entry
+    # points, tests and workers only pay for the stack they touch.
+    from .routes import execution_blp, generation_blp, health_blp, reports_blp, srs_blp
+
+    api.register_blueprint(health_blp)
+    api.register_blueprint(srs_blp)
+    api.register_blueprint(generation_blp)
+    api.register_blueprint(execution_blp)
+    api.register_blueprint(reports_blp)
+
+    # Probe fast path: k8s liveness/readiness hit this every few
+    # seconds, so skip the flask-smorest MethodView/schema stack (the
+    # documented "/" route stays for API consumers) and OPTIONS
+    # handling, answering with constant bytes.
+    _healthy = b'{"message":"Healthy"}'
+
+    @app.route("/healthz", provide_automatic_options=False)
+    def healthz():
+        return Response(_healthy, mimetype="application/json")
+
+    if not app.debug:
+        _cache_openapi_spec(app, api)
+
+    register_error_handlers(app)
+
+    @app.cli.command("create-db")
+    def create_db():
+        """Create all database tables."""
+        from . import models  # noqa: F401  (registers the mappers)
+
+        db.create_all()
+
+    return app
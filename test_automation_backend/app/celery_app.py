@@ -0,0 +1,50 @@
+"""Optional Celery wiring for background generation and execution.
+
+Celery is not a hard dependency: deployments that want real workers
+install ``celery[redis]`` and set ``CELERY_BROKER_URL``; everything else
+falls back to the in-process pool in :mod:`app.tasks`.  Task bodies live
+in ``app.tasks`` so both dispatch modes run identical code.
+"""
+
+try:
+    from celery import Celery
+except ImportError:  # pragma: no cover - celery is optional
+    Celery = None
+
+# LLM-bound generation and pytest execution scale differently, so they
+# get separate queues a deployment can size independently.
+TASK_ROUTES = {
+    "app.tasks.generate_cases": {"queue": "generation"},
+    "app.tasks.generate_scripts": {"queue": "generation"},
+    "app.tasks.execute_run": {"queue": "execution"},
+}
+
+
+def make_celery(app):
+    """Return a Celery app bound to ``app``, or None when unavailable.
+
+    Returns None when celery is not installed or no broker is
+    configured; callers then use the thread-pool fallback.
+    """
+    if Celery is None or not app.config.get("CELERY_BROKER_URL"):
+        return None
+
+    celery = Celery(
+        app.import_name,
+        broker=app.config["CELERY_BROKER_URL"],
+        backend=app.config.get("CELERY_RESULT_BACKEND"),
+    )
+    celery.conf.task_routes = TASK_ROUTES
+
+    class AppContextTask(celery.Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery.Task = AppContextTask
+
+    from . import tasks
+
+    for name, runner in tasks.TASK_RUNNERS.items():
+        celery.task(name=f"app.tasks.{name}")(runner)
+    return celery
@@ -0,0 +1,80 @@
+"""Application configuration classes and environment selection."""
+
+import functools
+import os
+
+_ENV = (os.getenv("REACT_APP_NODE_ENV") or os.getenv("FLASK_ENV") or "development").lower()
+
+
+class BaseConfig:
+    """Settings shared by every environment."""
+
+    API_TITLE = "AI Verification & Validation Automation API"
+    API_VERSION = "v1"
+    OPENAPI_VERSION = "3.0.3"
+    OPENAPI_URL_PREFIX = "/docs"
+    OPENAPI_SWAGGER_UI_PATH = "/swagger"
+    OPENAPI_SWAGGER_UI_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
+    # Finalized once when flask-smorest builds the APISpec, instead of
+    # mutating spec components/tags after Api(app) initialization.
+    API_SPEC_OPTIONS = {
+        "tags": [
+            {"name": "health", "description": "Service health"},
+            {"name": "srs", "description": "SRS intake and versioning"},
+        ],
+        "components": {"securitySchemes": {}},
+    }
+
+    DEFAULT_SQLITE_PATH = os.path.join(os.getcwd(), "test_automation.db")
+    SQLALCHEMY_DATABASE_URI = os.getenv(
+        "DATABASE_URL", "sqlite:///" + DEFAULT_SQLITE_PATH
+    )
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Concurrent /execution and /reports traffic needs a resilient pool;
+    # the SQLite-specific connect args are invalid for other drivers.
+    if SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "connect_args": {"check_same_thread": False, "timeout": 10},
+            "execution_options": {"compiled_cache": {}},
+        }
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "pool_size": 10,
+            "max_overflow": 20,
+            "execution_options": {"compiled_cache": {}},
+        }
+
+    # Unset by default: without a broker, background tasks fall back to
+    # the in-process pool (see app.tasks).
+    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+    CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
+
+    STORAGE_DIR = os.getenv("STORAGE_DIR", os.path.join(os.getcwd(), "storage"))
+    EXECUTION_MODE = os.getenv("EXECUTION_MODE", "mock")
+    RUN_POOL_WORKERS = int(os.getenv("RUN_POOL", "4"))
+    FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "*")
+
+
+class DevelopmentConfig(BaseConfig):
+    DEBUG = True
+
+
+class ProductionConfig(BaseConfig):
+    DEBUG = False
+
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Return the config class for the current environment.
+
+    Cached: the environment is resolved once at import and the class
+    lookup never changes within a process, so repeat calls (tests,
+    reloader, multiple factories) skip the env-var reads.
+    """
+    if _ENV.startswith("prod"):
+        return ProductionConfig
+    return DevelopmentConfig
@@ -0,0 +1,82 @@
+"""API error type and Flask error handlers.
+
+The 400/404/500 bodies are constants, so they are serialized once at
+import time and served as raw bytes — no jsonify/JSON-provider work per
+error response.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+from flask import Response
+
+_NOT_FOUND = b'{"code":404,"status":"not_found","message":"Resource not found"}'
+_BAD_REQUEST = b'{"code":400,"status":"bad_request","message":"Bad request"}'
+_INTERNAL = b'{"code":500,"status":"error","message":"Internal server error"}'
+
+# Serialized payloads for repeat ApiErrors without detail lists; entries
+# are only stored after json.dumps succeeded, so a failed serialization
+# is never cached.
+_payload_cache = {}
+
+
+@dataclass(slots=True)
+class ApiError(Exception):
+    """Application-level error carrying an HTTP status and payload."""
+
+    code: int = 500
+    status: str = "error"
+    message: str = "Internal server error"
+    errors: Optional[List[str]] = None
+
+    def __reduce__(self):
+        # BaseException pickles via self.args, which the generated
+        # slotted __init__ never populates; rebuild from fields instead.
+        return (self.__class__, (self.code, self.status, self.message, self.errors))
+
+    def to_response(self):
+        if self.errors:
+            body = json.dumps(
+                {
+                    "code": self.code,
+                    "status": self.status,
+                    "message": self.message,
+                    "errors": self.errors,
+                },
+                separators=(",", ":"),
+            ).encode()
+        else:
+            key = (self.code, self.status, self.message)
+            body = _payload_cache.get(key)
+            if body is None:
+                body = json.dumps(
+                    {"code": self.code, "status": self.status, "message": self.message},
+                    separators=(",", ":"),
+                ).encode()
+                _payload_cache[key] = body
+        return Response(body, status=self.code, mimetype="application/json")
+
+
+def handle_api_error(err):
+    return err.to_response()
+
+
+def handle_not_found(err):
+    return Response(_NOT_FOUND, status=404, mimetype="application/json")
+
+
+def handle_bad_request(err):
+    return Response(_BAD_REQUEST, status=400, mimetype="application/json")
+
+
+def handle_internal_error(err):
+    return Response(_INTERNAL, status=500, mimetype="application/json")
+
+
+def register_error_handlers(app):
+    """Attach the standard JSON error handlers to ``app``."""
+    app.register_error_handler(ApiError, handle_api_error)
+    app.register_error_handler(404, handle_not_found)
+    app.register_error_handler(400, handle_bad_request)
+    app.register_error_handler(500, handle_internal_error)
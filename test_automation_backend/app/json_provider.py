@@ -0,0 +1,18 @@
+"""orjson-backed JSON provider for Flask responses."""
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+
+
+class OrjsonProvider(JSONProvider):
+    """Serialize with orjson: C-speed encoding, compact output, native
+    datetime/dataclass support (so route payloads can return model
+    fields directly)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_OPTIONS, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
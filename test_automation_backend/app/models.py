@@ -0,0 +1,177 @@
+"""Database models plus lightweight filesystem metadata records."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .extensions import db
+from .utils import generate_id
+
+
+class SRS(db.Model):
+    __tablename__ = "srs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("srs-"))
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    uploaded_by: Mapped[Optional[str]] = mapped_column(String(255))
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    versions = relationship("SRSVersion", back_populates="srs", lazy="raise")
+
+
+class SRSVersion(db.Model):
+    __tablename__ = "srs_versions"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("srsv-"))
+    srs_id: Mapped[str] = mapped_column(ForeignKey("srs.id"), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    storage_path: Mapped[str] = mapped_column(String(512), nullable=False)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    srs = relationship("SRS", back_populates="versions", lazy="raise")
+    test_cases = relationship("TestCase", back_populates="srs_version", lazy="raise")
+
+
+class TestCase(db.Model):
+    __tablename__ = "test_cases"
+    __table_args__ = (
+        Index("ix_testcase_status", "status"),
+        Index("ix_testcase_requirement", "requirement_id"),
+        # Report aggregation filters on (srs_version_id, status).
+        Index("ix_testcase_srsver_status", "srs_version_id", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("tc-"))
+    srs_version_id: Mapped[str] = mapped_column(ForeignKey("srs_versions.id"), nullable=False)
+    requirement_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    priority: Mapped[Optional[str]] = mapped_column(String(16))
+    status: Mapped[str] = mapped_column(String(32), default="draft")
+    # Attribute is "meta": naming it "metadata" would collide with
+    # DeclarativeBase.metadata; the DB column keeps its original name.
+    meta: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    srs_version = relationship("SRSVersion", back_populates="test_cases", lazy="raise")
+    scripts = relationship("TestScript", back_populates="test_case", lazy="raise")
+
+
+class TestScript(db.Model):
+    __tablename__ = "test_scripts"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("ts-"))
+    test_case_id: Mapped[str] = mapped_column(ForeignKey("test_cases.id"), nullable=False)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    code: Mapped[str] = mapped_column(Text, nullable=False)
+    language: Mapped[str] = mapped_column(String(32), default="python")
+    framework: Mapped[str] = mapped_column(String(32), default="pytest-playwright")
+    gen_metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    test_case = relationship("TestCase", back_populates="scripts", lazy="raise")
+
+
+class TestRun(db.Model):
+    __tablename__ = "test_runs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("run-"))
+    srs_version_id: Mapped[str] = mapped_column(ForeignKey("srs_versions.id"), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), default="pending")
+    triggered_by: Mapped[Optional[str]] = mapped_column(String(255))
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    passed: Mapped[int] = mapped_column(Integer, default=0)
+    failed: Mapped[int] = mapped_column(Integer, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    results = relationship("TestResult", back_populates="test_run", lazy="raise")
+
+
+class TestResult(db.Model):
+    __tablename__ = "test_results"
+    __table_args__ = (
+        Index("ix_testresult_status", "status"),
+        # /runs/<id>/results and totals filter on (test_run_id, status).
+        Index("ix_testresult_run_status", "test_run_id", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("res-"))
+    test_run_id: Mapped[str] = mapped_column(ForeignKey("test_runs.id"), nullable=False)
+    test_case_id: Mapped[Optional[str]] = mapped_column(ForeignKey("test_cases.id"))
+    status: Mapped[str] = mapped_column(String(32), default="pending")
+    duration_seconds: Mapped[Optional[float]] = mapped_column(Float)
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    test_run = relationship("TestRun", back_populates="results", lazy="raise")
+    test_case = relationship("TestCase", lazy="raise")
+
+
+class Artifact(db.Model):
+    __tablename__ = "artifacts"
+    __table_args__ = (
+        Index("ix_artifact_kind", "kind"),
+        Index("ix_artifact_run_kind", "test_run_id", "kind"),
+        Index("ix_artifact_script_kind", "script_id", "kind"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: generate_id("art-"))
+    test_run_id: Mapped[str] = mapped_column(ForeignKey("test_runs.id"), nullable=False)
+    script_id: Mapped[Optional[str]] = mapped_column(ForeignKey("test_scripts.id"))
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    path: Mapped[str] = mapped_column(String(512), nullable=False)
+    # Attribute is "meta": naming it "metadata" would collide with
+    # DeclarativeBase.metadata; the DB column keeps its original name.
+    meta: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    test_run = relationship("TestRun", lazy="raise")
+
+
+@dataclass(slots=True)
+class Job:
+    """Filesystem-backed generation job metadata."""
+
+    id: str
+    name: str = ""
+    status: str = "created"
+    created_at: str = ""
+    meta: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Run:
+    """Filesystem-backed execution run metadata."""
+
+    id: str
+    job_id: str = ""
+    status: str = "pending"
+    started_at: str = ""
+    finished_at: str = ""
+
+
+@dataclass(slots=True)
+class Report:
+    """Aggregated result summary for a filesystem run."""
+
+    run_id: str
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    duration_seconds: float = 0.0
+    generated_at: str = ""
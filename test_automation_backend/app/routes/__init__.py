@@ -0,0 +1,29 @@
+"""Route blueprints, exposed lazily.
+
+Each blueprint pulls in its services (and transitively SQLAlchemy,
+marshmallow, the LLM stack, ...), so importing them eagerly would make
+every CLI entry point pay for the whole application.  Blueprints are
+imported on first attribute access instead (PEP 562).
+"""
+
+import importlib
+
+_BLUEPRINT_MODULES = {
+    "health_blp": "health",
+    "srs_blp": "srs",
+    "generation_blp": "generation",
+    "execution_blp": "execution",
+    "reports_blp": "reports",
+}
+
+__all__ = list(_BLUEPRINT_MODULES)
+
+
+def __getattr__(name):
+    module_name = _BLUEPRINT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    blp = module.blp
+    globals()[name] = blp
+    return blp
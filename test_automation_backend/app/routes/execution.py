@@ -0,0 +1,147 @@
+"""Run triggering, status and export endpoints."""
+
+import csv
+import io
+
+from flask import Response, make_response, request, send_file, stream_with_context
+from flask.views import MethodView
+from flask_smorest import Blueprint
+from sqlalchemy import func, select
+
+from .. import tasks
+from ..extensions import db
+from ..models import TestResult
+from ..services.services import ExecutionService, ResultsService, SRSService
+from ..services.test_script_execution import execute_tests_for_job
+
+# Below this many rows the buffered service export is cheaper than
+# setting up a streamed response.
+_CSV_STREAM_THRESHOLD = 1000
+
+blp = Blueprint("execution", __name__, url_prefix="/api", description="Execution")
+
+
+def _run_payload(run):
+    # datetime/None pass straight through: the orjson provider emits
+    # RFC 3339 / null without per-row Python-side formatting.
+    return {
+        "id": run.id,
+        "srs_version_id": run.srs_version_id,
+        "status": run.status,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "total": run.total,
+        "passed": run.passed,
+        "failed": run.failed,
+        "skipped": run.skipped,
+    }
+
+
+@blp.route("/versions/<version_id>/runs")
+class TriggerRun(MethodView):
+    def post(self, version_id):
+        """Queue a test run; poll /api/jobs/<jobId> for the run id."""
+        SRSService.get_version(version_id)
+        job_id = tasks.submit(
+            "execute_run", version_id, triggered_by=request.headers.get("X-User")
+        )
+        return {"jobId": job_id}, 202
+
+
+@blp.route("/runs/<run_id>")
+class RunStatus(MethodView):
+    def get(self, run_id):
+        """Return current status and totals for a run."""
+        run = ExecutionService.get_run(run_id)
+        return _run_payload(run)
+
+
+@blp.route("/runs/<run_id>/results")
+class RunResults(MethodView):
+    def get(self, run_id):
+        """List per-case results for a run."""
+        results = ResultsService.get_run_results(run_id)
+        return [
+            {
+                "id": r.id,
+                "test_case_id": r.test_case_id,
+                "status": r.status,
+                "duration_seconds": r.duration_seconds,
+                "error_message": r.error_message,
+            }
+            for r in results
+        ]
+
+
+@blp.route("/runs/<run_id>/export.csv")
+class ExportResultsCSV(MethodView):
+    def get(self, run_id):
+        """Download the run's results as CSV.
+
+        Large runs are streamed in 1000-row batches so the export stays
+        constant-memory and the first bytes go out after one query
+        round trip.
+        """
+        ExecutionService.get_run(run_id)  # 404 before any bytes are sent
+        row_count = db.session.execute(
+            select(func.count(TestResult.id)).where(TestResult.test_run_id == run_id)
+        ).scalar()
+        if row_count < _CSV_STREAM_THRESHOLD:
+            fname, blob = ResultsService.export_results_csv(run_id)
+            response = make_response(blob)
+            response.headers["Content-Type"] = "text/csv"
+            response.headers["Content-Disposition"] = f"attachment; filename={fname}"
+            return response
+
+        def generate():
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(["id", "test_case_id", "status", "duration_seconds", "error_message"])
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            rows = db.session.execute(
+                select(
+                    TestResult.id,
+                    TestResult.test_case_id,
+                    TestResult.status,
+                    TestResult.duration_seconds,
+                    TestResult.error_message,
+                ).where(TestResult.test_run_id == run_id)
+            ).yield_per(_CSV_STREAM_THRESHOLD)
+            for partition in rows.partitions():
+                writer.writerows(partition)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=results-{run_id}.csv"},
+        )
+
+
+@blp.route("/versions/<version_id>/scripts.zip")
+class ExportScriptsZip(MethodView):
+    def get(self, version_id):
+        """Download all generated scripts for a version as a ZIP.
+
+        The archive is assembled in a spooled temp file and streamed,
+        so large exports never hold the full blob in memory.
+        """
+        fname, fileobj = ResultsService.export_scripts_zip(version_id)
+        return send_file(
+            fileobj,
+            mimetype="application/zip",
+            as_attachment=True,
+            download_name=fname,
+        )
+
+
+@blp.route("/jobs/<job_id>/execute")
+class JobExecute(MethodView):
+    def post(self, job_id):
+        """Execute the generated pytest files for a filesystem job."""
+        run_id, report = execute_tests_for_job(job_id)
+        return {"runId": run_id, "report": report}, 201
@@ -0,0 +1,90 @@
+"""Test case and script generation endpoints (DB versions and filesystem jobs)."""
+
+from datetime import datetime
+
+from flask import current_app, request
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from .. import tasks
+from ..errors import ApiError
+from ..services.pipeline import run_generation
+from ..services.services import SRSService
+from ..services.test_case_creation import generate_test_cases_for_job
+from ..services.test_script_execution import generate_test_scripts_for_job
+from ..utils import generate_id
+
+blp = Blueprint("generation", __name__, url_prefix="/api", description="Generation")
+
+
+@blp.route("/versions/<version_id>/generate-cases")
+class GenerateCases(MethodView):
+    def post(self, version_id):
+        """Queue test-case generation; poll /api/jobs/<jobId> for progress."""
+        SRSService.get_version(version_id)  # 404 before queuing
+        job_id = tasks.submit("generate_cases", version_id)
+        return {"jobId": job_id}, 202
+
+
+@blp.route("/versions/<version_id>/generate-scripts")
+class GenerateScripts(MethodView):
+    def post(self, version_id):
+        """Queue pytest script generation; poll /api/jobs/<jobId>."""
+        SRSService.get_version(version_id)
+        job_id = tasks.submit("generate_scripts", version_id)
+        return {"jobId": job_id}, 202
+
+
+@blp.route("/jobs")
+class Jobs(MethodView):
+    def post(self):
+        """Create a filesystem job, optionally seeding input CSVs."""
+        storage = current_app.extensions["storage"]
+        job_id = generate_id("job-")
+        meta = {
+            "id": job_id,
+            "name": request.form.get("name", job_id),
+            "status": "created",
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        input_dir = storage.get_job_input_dir(job_id)
+        for file in request.files.getlist("file"):
+            if file.filename:
+                file.save(storage.safe_join(input_dir, file.filename))
+        storage.save_job_metadata(job_id, meta)
+        return {"jobId": job_id}, 201
+
+
+@blp.route("/jobs/<job_id>")
+class JobDetails(MethodView):
+    def get(self, job_id):
+        """Fetch job metadata."""
+        storage = current_app.extensions["storage"]
+        meta = storage.load_job_metadata(job_id)
+        if meta is None:
+            raise ApiError(code=404, status="not_found", message="Job not found")
+        return meta
+
+
+@blp.route("/jobs/<job_id>/generate-cases")
+class JobGenerateCases(MethodView):
+    def post(self, job_id):
+        """Generate test cases from the job's input CSVs."""
+        cases = generate_test_cases_for_job(job_id)
+        return {"jobId": job_id, "caseCount": len(cases)}, 201
+
+
+@blp.route("/jobs/<job_id>/generate-scripts")
+class JobGenerateScripts(MethodView):
+    def post(self, job_id):
+        """Render pytest files for the job's generated cases."""
+        files = generate_test_scripts_for_job(job_id)
+        return {"jobId": job_id, "files": files}, 201
+
+
+@blp.route("/jobs/<job_id>/generate")
+class JobGenerate(MethodView):
+    def post(self, job_id):
+        """Generate cases and scripts in one fused pass."""
+        cases, files = run_generation(job_id)
+        return {"jobId": job_id, "caseCount": len(cases), "files": files}, 201
@@ -0,0 +1,16 @@
+"""Health check endpoints."""
+
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from ..schemas import MessageSchema
+
+blp = Blueprint("health", __name__, description="Service health")
+
+
+@blp.route("/")
+class HealthCheck(MethodView):
+    @blp.response(200, MessageSchema)
+    def get(self):
+        """Liveness probe."""
+        return {"message": "Healthy"}
@@ -0,0 +1,83 @@
+"""Report and artifact endpoints for filesystem runs."""
+
+import html
+import os
+
+from flask import current_app, send_file, send_from_directory
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from ..errors import ApiError
+
+blp = Blueprint("reports", __name__, url_prefix="/api/reports", description="Reports")
+
+
+@blp.route("/runs")
+class Runs(MethodView):
+    def get(self):
+        """List all filesystem runs with their reports."""
+        storage = current_app.extensions["storage"]
+        return storage.list_runs()
+
+
+@blp.route("/runs/<run_id>")
+class RunDetails(MethodView):
+    def get(self, run_id):
+        """Fetch metadata for one run."""
+        storage = current_app.extensions["storage"]
+        meta = storage.load_run_metadata(run_id)
+        if meta is None:
+            raise ApiError(code=404, status="not_found", message="Run not found")
+        return meta
+
+
+@blp.route("/runs/<run_id>/report")
+class RunReport(MethodView):
+    def get(self, run_id):
+        """Fetch the aggregated report for a run."""
+        storage = current_app.extensions["storage"]
+        report = storage.load_report(run_id)
+        if report is None:
+            raise ApiError(code=404, status="not_found", message="Report not found")
+        return report
+
+
+@blp.route("/runs/<run_id>/report.html")
+class RunReportHTML(MethodView):
+    def get(self, run_id):
+        """Render (once) and serve an HTML summary of the run report."""
+        storage = current_app.extensions["storage"]
+        report = storage.load_report(run_id)
+        if report is None:
+            raise ApiError(code=404, status="not_found", message="Report not found")
+        html_path = os.path.join(storage.get_run_dir(run_id), "report.html")
+        if not os.path.exists(html_path):
+            rows = "".join(
+                f"<tr><td>{html.escape(str(k))}</td><td>{html.escape(str(v))}</td></tr>"
+                for k, v in report.items()
+            )
+            document = (
+                "<html><head><title>Run report</title></head><body>"
+                f"<h1>Run {html.escape(run_id)}</h1><table>{rows}</table>"
+                "</body></html>"
+            )
+            with open(html_path, "w", encoding="utf-8") as f:
+                f.write(document)
+        return send_file(
+            html_path, conditional=True, last_modified=os.path.getmtime(html_path)
+        )
+
+
+@blp.route("/runs/<run_id>/artifacts/<path:filename>")
+class RunArtifact(MethodView):
+    def get(self, run_id, filename):
+        """Serve one artifact file produced by a run.
+
+        send_from_directory performs the traversal check, 404s missing
+        files and enables conditional requests in one call, so browsers
+        re-fetching report HTML/screenshots get 304s and range support.
+        """
+        storage = current_app.extensions["storage"]
+        return send_from_directory(
+            storage.get_run_artifacts_dir(run_id), filename, conditional=True
+        )
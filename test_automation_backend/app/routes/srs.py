@@ -0,0 +1,141 @@
+"""SRS upload and listing endpoints."""
+
+import hashlib
+import os
+import tempfile
+
+from flask import current_app, request
+from flask.views import MethodView
+from flask_smorest import Blueprint
+from marshmallow import ValidationError
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import BaseTarget, ValueTarget
+
+from ..errors import ApiError
+from ..schemas import SRSSchema, SRSVersionSchema, UploadParamsSchema
+from ..services.services import SRSService
+from ..utils import StreamingSRSValidator
+
+_UPLOAD_CHUNK = 1 << 20
+
+blp = Blueprint("srs", __name__, url_prefix="/api/srs", description="SRS documents")
+
+
+class _HashedFileTarget(BaseTarget):
+    """Multipart file target that writes, hashes and validates chunks."""
+
+    # note: BaseTarget reserves the ``_validator`` attribute name
+    def __init__(self, path, digest, csv_validator):
+        super().__init__()
+        self._path = path
+        self._file = None
+        self._digest = digest
+        self._csv_validator = csv_validator
+
+    def on_start(self):
+        self._file = open(self._path, "wb")
+
+    def on_data_received(self, chunk):
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self._csv_validator.feed(chunk)
+
+    def on_finish(self):
+        if self._file is not None:
+            self._file.close()
+
+
+@blp.route("/upload")
+class SRSUpload(MethodView):
+    def post(self):
+        """Upload a new SRS CSV, creating a new version.
+
+        The multipart body is parsed with streaming-form-data in a
+        single pass (werkzeug's MultipartDecoder degrades quadratically
+        on large files), so the form must not be touched via
+        request.files/form here.  File chunks go straight to a temp
+        file while a rolling SHA-256 and the streaming CSV validator
+        consume the same buffers; the temp file is atomically renamed
+        into storage on success.  Form fields are still validated with
+        the marshmallow schema, just after parsing instead of before.
+        """
+        if not (request.content_type or "").startswith("multipart/form-data"):
+            raise ApiError(code=400, status="bad_request", message="Expected multipart/form-data")
+
+        srs_dir = os.path.join(current_app.config["STORAGE_DIR"], "srs")
+        os.makedirs(srs_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        validator = StreamingSRSValidator()
+        tmp = tempfile.NamedTemporaryFile(dir=srs_dir, suffix=".part", delete=False)
+        tmp.close()
+
+        parser = StreamingFormDataParser(headers=request.headers)
+        targets = {field: ValueTarget() for field in ("name", "uploaded_by", "notes")}
+        file_target = _HashedFileTarget(tmp.name, digest, validator)
+        for field, target in targets.items():
+            parser.register(field, target)
+        parser.register("file", file_target)
+
+        try:
+            try:
+                while chunk := request.stream.read(_UPLOAD_CHUNK):
+                    parser.data_received(chunk)
+            except UnicodeDecodeError:
+                raise ApiError(
+                    code=400, status="bad_request", message="SRS file must be UTF-8 encoded"
+                )
+
+            if not file_target.multipart_filename:
+                raise ApiError(code=400, status="bad_request", message="Missing 'file' upload")
+            form = {
+                field: target.value.decode() for field, target in targets.items() if target.value
+            }
+            try:
+                params = UploadParamsSchema().load(form)
+            except ValidationError as err:
+                raise ApiError(
+                    code=400,
+                    status="bad_request",
+                    message="Invalid upload parameters",
+                    errors=[f"{field}: {'; '.join(msgs)}" for field, msgs in err.messages.items()],
+                )
+
+            rows, errors = validator.close()
+            if errors:
+                raise ApiError(
+                    code=400, status="bad_request", message="Invalid SRS CSV", errors=errors
+                )
+            srs, version, row_count = SRSService.upload_srs(
+                name=params["name"],
+                uploaded_by=params.get("uploaded_by"),
+                notes=params.get("notes"),
+                filename=file_target.multipart_filename,
+                tmp_path=tmp.name,
+                checksum=digest.hexdigest(),
+                rows=rows,
+            )
+        finally:
+            if os.path.exists(tmp.name):
+                os.unlink(tmp.name)
+        return {
+            "srsId": srs.id,
+            "versionId": version.id,
+            "version": version.version,
+            "rowCount": row_count,
+        }, 201
+
+
+@blp.route("")
+class SRSList(MethodView):
+    @blp.response(200, SRSSchema(many=True))
+    def get(self):
+        """List active SRS documents."""
+        return SRSService.list_srs()
+
+
+@blp.route("/<srs_id>/versions")
+class SRSVersions(MethodView):
+    @blp.response(200, SRSVersionSchema(many=True))
+    def get(self, srs_id):
+        """List versions of an SRS document."""
+        return SRSService.list_versions(srs_id)
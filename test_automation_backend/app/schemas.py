@@ -0,0 +1,80 @@
+"""Marshmallow schemas used by the flask-smorest blueprints."""
+
+from marshmallow import Schema, fields
+
+
+class MessageSchema(Schema):
+    message = fields.String()
+
+
+class UploadParamsSchema(Schema):
+    name = fields.String(required=True)
+    uploaded_by = fields.String(load_default=None)
+    notes = fields.String(load_default=None)
+
+
+class SRSSchema(Schema):
+    id = fields.String()
+    name = fields.String()
+    description = fields.String(allow_none=True)
+    uploaded_by = fields.String(allow_none=True)
+    created_at = fields.DateTime()
+
+
+class SRSVersionSchema(Schema):
+    id = fields.String()
+    srs_id = fields.String()
+    version = fields.Integer()
+    filename = fields.String()
+    file_hash = fields.String()
+    notes = fields.String(allow_none=True)
+    created_at = fields.DateTime()
+
+
+class TestCaseSchema(Schema):
+    id = fields.String()
+    srs_version_id = fields.String()
+    requirement_id = fields.String()
+    title = fields.String()
+    description = fields.String(allow_none=True)
+    priority = fields.String(allow_none=True)
+    status = fields.String()
+
+
+class TestRunSchema(Schema):
+    id = fields.String()
+    srs_version_id = fields.String()
+    status = fields.String()
+    started_at = fields.String(allow_none=True)
+    finished_at = fields.String(allow_none=True)
+    total = fields.Integer()
+    passed = fields.Integer()
+    failed = fields.Integer()
+    skipped = fields.Integer()
+
+
+class TestResultSchema(Schema):
+    id = fields.String()
+    test_run_id = fields.String()
+    test_case_id = fields.String(allow_none=True)
+    status = fields.String()
+    duration_seconds = fields.Float(allow_none=True)
+    error_message = fields.String(allow_none=True)
+
+
+class JobSchema(Schema):
+    id = fields.String()
+    name = fields.String()
+    status = fields.String()
+    created_at = fields.String()
+    meta = fields.Dict()
+
+
+class ReportSchema(Schema):
+    run_id = fields.String()
+    total = fields.Integer()
+    passed = fields.Integer()
+    failed = fields.Integer()
+    skipped = fields.Integer()
+    duration_seconds = fields.Float()
+    generated_at = fields.String()
@@ -0,0 +1 @@
+"""Service layer: storage, LLM access, and generation/execution services."""
@@ -0,0 +1,46 @@
+"""Fused generation pipeline for filesystem jobs.
+
+Running case derivation and script rendering as separate requests
+round-trips the cases list through cases.json between the stages.
+:func:`run_generation` keeps it in memory: scripts are rendered straight
+from the freshly generated cases while a background thread persists the
+JSON document, so the disk write overlaps the script rendering instead
+of sitting between the stages.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ..errors import ApiError
+from .storage import Storage
+from .test_case_creation import _collect_rows, _generate_cases, _persist_cases
+from .test_script_execution import _write_script_files
+
+
+def run_generation(job_id):
+    """Generate cases and scripts for a job in one fused pass.
+
+    Returns ``(cases, files)``; the job metadata ends in the same
+    ``scripts_generated`` state the two-step flow produces.
+    """
+    storage = Storage.instance()
+    meta = storage.load_job_metadata(job_id)
+    if meta is None:
+        raise ApiError(code=404, status="not_found", message="Job not found")
+
+    cases = _generate_cases(_collect_rows(storage, job_id))
+
+    # The future carries the persist's exception across the thread
+    # boundary: a failed cases.json write fails the request instead of
+    # leaving a job that claims success without its cases document.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        persist = pool.submit(_persist_cases, storage, job_id, cases)
+        try:
+            files = _write_script_files(storage, job_id, cases)
+        finally:
+            persist.result()
+
+    meta["status"] = "scripts_generated"
+    meta["case_count"] = len(cases)
+    meta["script_count"] = len(files)
+    storage.save_job_metadata(job_id, meta)
+    return cases, files
@@ -0,0 +1,552 @@
+"""Database-backed services for SRS intake, generation and execution."""
+
+import csv
+import functools
+import importlib.util
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from xml.etree import ElementTree
+
+from flask import current_app
+from sqlalchemy.orm import load_only, selectinload
+
+from ..errors import ApiError
+from ..extensions import db
+from ..models import SRS, SRSVersion, TestCase, TestResult, TestRun, TestScript
+from ..utils import generate_id, sanitize_identifier, validate_srs_csv, write_zip_to_stream
+from .llm import get_llm
+
+
+def _write_rows_sidecar(storage_path, file_hash, rows):
+    """Persist parsed SRS rows next to the CSV for later reuse."""
+    with open(storage_path + ".rows", "w", encoding="utf-8") as f:
+        json.dump({"file_hash": file_hash, "rows": rows}, f, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_rows_sidecar(sidecar_path, file_hash):
+    """Return the pre-parsed rows for an SRS version, or None on miss.
+
+    A version's file is immutable once stored (its SHA-256 is recorded),
+    so rows keyed by that hash never go stale and the small LRU is safe.
+    Callers must treat the returned rows as read-only.
+    """
+    try:
+        with open(sidecar_path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if payload.get("file_hash") != file_hash:
+        return None
+    return payload["rows"]
+
+
+class SRSService:
+    """Upload and list software requirement specifications."""
+
+    @staticmethod
+    def upload_srs(name, uploaded_by, notes, filename, tmp_path, checksum, rows):
+        """Persist an already-validated upload.
+
+        The route streams the request body to ``tmp_path`` while hashing
+        and validating it, so this method only records the version and
+        atomically renames the temp file into place — the file bytes are
+        never held in memory here.  The parsed ``rows`` are written to a
+        sidecar so generation never has to re-validate the CSV.
+        """
+        srs = SRS.query.filter_by(name=name, is_active=True).first()
+        if srs is None:
+            srs = SRS(name=name, uploaded_by=uploaded_by)
+            db.session.add(srs)
+            db.session.flush()
+
+        version_no = (
+            db.session.query(db.func.count(SRSVersion.id)).filter_by(srs_id=srs.id).scalar() or 0
+        ) + 1
+        srs_dir = os.path.join(current_app.config["STORAGE_DIR"], "srs")
+        os.makedirs(srs_dir, exist_ok=True)
+        storage_path = os.path.join(srs_dir, f"{srs.id}-v{version_no}-{filename}")
+        os.replace(tmp_path, storage_path)
+        _write_rows_sidecar(storage_path, checksum, rows)
+
+        version = SRSVersion(
+            srs_id=srs.id,
+            version=version_no,
+            filename=filename,
+            file_hash=checksum,
+            storage_path=storage_path,
+            notes=notes,
+        )
+        db.session.add(version)
+        db.session.commit()
+        return srs, version, len(rows)
+
+    @staticmethod
+    def list_srs():
+        # load_only keeps the rows as wide as the response schema; the
+        # unread columns are never transferred or hydrated.
+        return (
+            db.session.query(SRS)
+            .options(
+                load_only(SRS.id, SRS.name, SRS.description, SRS.uploaded_by, SRS.created_at)
+            )
+            .filter_by(is_active=True)
+            .all()
+        )
+
+    @staticmethod
+    def list_versions(srs_id):
+        return (
+            db.session.query(SRSVersion)
+            .options(
+                load_only(
+                    SRSVersion.id,
+                    SRSVersion.srs_id,
+                    SRSVersion.version,
+                    SRSVersion.filename,
+                    SRSVersion.file_hash,
+                    SRSVersion.notes,
+                    SRSVersion.created_at,
+                )
+            )
+            .filter_by(srs_id=srs_id, is_active=True)
+            .order_by(SRSVersion.version)
+            .all()
+        )
+
+    @staticmethod
+    def get_version(version_id):
+        version = db.session.get(SRSVersion, version_id)
+        if version is None or not version.is_active:
+            raise ApiError(code=404, status="not_found", message="SRS version not found")
+        return version
+
+
+# Rows per LLM prompt and concurrent in-flight prompts.  Batching turns
+# N round trips into N/20, and the pool overlaps the remaining
+# I/O-bound calls.
+_LLM_BATCH_SIZE = 20
+_LLM_MAX_WORKERS = 4
+
+
+class LLMService:
+    """Turn SRS rows into structured test-case dicts via the LLM."""
+
+    @staticmethod
+    def _batch_prompt(rows):
+        lines = [
+            "For each requirement below, produce a functional test case. "
+            "Respond with a JSON array of objects with keys "
+            "requirement_id, title, description, priority.",
+            "Requirements:",
+        ]
+        for row in rows:
+            lines.append(
+                f"- {row.get('requirement_id')}: {row.get('title')} — {row.get('description')}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _fallback_case(row):
+        return {
+            "title": f"Verify {row.get('title') or row.get('requirement_id')}",
+            "description": row.get("description") or "",
+            "priority": "medium",
+        }
+
+    @staticmethod
+    def _generate_batch(rows):
+        """Generate cases for one batch, one row each, LLM-or-fallback."""
+        text = get_llm().generate_text(LLMService._batch_prompt(rows))
+        parsed = []
+        if text:
+            try:
+                data = json.loads(text)
+            except (ValueError, TypeError):
+                data = None
+            if isinstance(data, dict):
+                data = data.get("test_cases")
+            if isinstance(data, list):
+                parsed = [c for c in data if isinstance(c, dict)]
+        by_rid = {str(c.get("requirement_id")): c for c in parsed}
+        cases = []
+        for row in rows:
+            case = by_rid.get(str(row.get("requirement_id"))) or LLMService._fallback_case(row)
+            case["requirement_id"] = row.get("requirement_id")
+            cases.append(case)
+        return cases
+
+    @staticmethod
+    def generate_test_cases(rows):
+        batches = [
+            rows[i : i + _LLM_BATCH_SIZE] for i in range(0, len(rows), _LLM_BATCH_SIZE)
+        ]
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return LLMService._generate_batch(batches[0])
+        with ThreadPoolExecutor(max_workers=min(_LLM_MAX_WORKERS, len(batches))) as pool:
+            return [case for batch in pool.map(LLMService._generate_batch, batches) for case in batch]
+
+
+# Hoisted so bulk generation expands a prebuilt template per case
+# instead of re-evaluating a 20-line f-string.
+_SCRIPT_TEMPLATE = '''"""
+Auto-generated pytest/Playwright script.
+
+Requirement: {requirement_id}
+Title: {title}
+"""
+
+
+def test_{func_name}(page):
+    """{title}"""
+    # Description: {description}
+    # TODO: replace with real Playwright steps for this requirement.
+    assert page is not None
+'''
+
+
+class ScriptService:
+    """Render pytest/Playwright scripts for test cases."""
+
+    @staticmethod
+    def generate_pytest_playwright_script(test_case):
+        func_name = sanitize_identifier(f"{test_case.requirement_id}_{test_case.title}").replace("-", "_")
+        code = _SCRIPT_TEMPLATE.format_map(
+            {
+                "requirement_id": test_case.requirement_id,
+                "title": test_case.title,
+                "func_name": func_name,
+                "description": test_case.description or "",
+            }
+        )
+        return f"test_{func_name}.py", code
+
+
+class GenerationService:
+    """Generate test cases and scripts for a stored SRS version."""
+
+    @staticmethod
+    def generate_test_cases_for_version(version_id):
+        version = SRSService.get_version(version_id)
+        # The upload wrote a sidecar of pre-parsed rows keyed by the
+        # file hash; re-reading and re-validating the CSV is only needed
+        # for versions stored before sidecars existed.
+        rows = _load_rows_sidecar(version.storage_path + ".rows", version.file_hash)
+        if rows is None:
+            with open(version.storage_path, encoding="utf-8-sig") as f:
+                text = f.read()
+            rows, errors = validate_srs_csv(text)
+            if errors:
+                raise ApiError(
+                    code=400, status="bad_request", message="Stored SRS is invalid", errors=errors
+                )
+            _write_rows_sidecar(version.storage_path, version.file_hash, rows)
+
+        case_dicts = LLMService.generate_test_cases(rows)
+        # Plain dicts + bulk_insert_mappings: one INSERT without the
+        # per-row identity-map bookkeeping of session.add.
+        cases = [
+            {
+                "id": generate_id("tc-"),
+                "srs_version_id": version.id,
+                "requirement_id": cd.get("requirement_id") or "",
+                "title": cd.get("title") or "",
+                "description": cd.get("description"),
+                "priority": cd.get("priority"),
+                "status": "generated",
+            }
+            for cd in case_dicts
+        ]
+        if cases:
+            db.session.bulk_insert_mappings(TestCase, cases)
+        db.session.commit()
+        return cases
+
+    @staticmethod
+    def generate_scripts_for_version(version_id):
+        version = SRSService.get_version(version_id)
+        # selectinload batches the scripts relationship into one extra
+        # query; relationships are lazy="raise", so the traversal below
+        # must opt in explicitly.
+        cases = (
+            db.session.query(TestCase)
+            .options(selectinload(TestCase.scripts))
+            .filter_by(srs_version_id=version.id, is_active=True)
+            .all()
+        )
+        pending = [case for case in cases if not any(s.is_active for s in case.scripts)]
+        return GenerationService.create_scripts_for_cases(pending)
+
+    @staticmethod
+    def create_scripts_for_cases(cases):
+        """Render and insert scripts for ``cases`` in one batched INSERT."""
+        generated_at = datetime.utcnow().isoformat()
+        rows = []
+        with db.session.no_autoflush:
+            for case in cases:
+                filename, code = ScriptService.generate_pytest_playwright_script(case)
+                rows.append(
+                    {
+                        "id": generate_id("ts-"),
+                        "test_case_id": case.id,
+                        "filename": filename,
+                        "code": code,
+                        "gen_metadata": {"generated_at": generated_at},
+                    }
+                )
+        if rows:
+            db.session.bulk_insert_mappings(TestScript, rows)
+        db.session.commit()
+        return rows
+
+
+def _parse_junit(path):
+    """Map test function names to (status, duration, message) from junit XML."""
+    outcomes = {}
+    try:
+        root = ElementTree.parse(path).getroot()
+    except (OSError, ElementTree.ParseError):
+        return outcomes
+    for tc in root.iter("testcase"):
+        status, message = "passed", None
+        for child in tc:
+            if child.tag in ("failure", "error"):
+                status = "failed"
+                message = (child.get("message") or child.text or "").strip() or None
+                break
+            if child.tag == "skipped":
+                status = "skipped"
+                break
+        outcomes[tc.get("name") or ""] = (status, float(tc.get("time") or 0.0), message)
+    return outcomes
+
+
+class ExecutionService:
+    """Trigger and complete test runs."""
+
+    @staticmethod
+    def trigger_run(version_id, triggered_by=None):
+        version = SRSService.get_version(version_id)
+        cases = (
+            db.session.query(TestCase)
+            .filter_by(srs_version_id=version.id, is_active=True)
+            .all()
+        )
+        if not cases:
+            raise ApiError(code=400, status="bad_request", message="No test cases for this version")
+
+        run = TestRun(
+            srs_version_id=version.id,
+            triggered_by=triggered_by,
+            status="queued",
+            started_at=datetime.utcnow(),
+            total=len(cases),
+        )
+        db.session.add(run)
+        db.session.flush()
+        db.session.bulk_insert_mappings(
+            TestResult,
+            [
+                {
+                    "id": generate_id("res-"),
+                    "test_run_id": run.id,
+                    "test_case_id": case.id,
+                    "status": "pending",
+                }
+                for case in cases
+            ],
+        )
+        db.session.commit()
+
+        if current_app.config.get("EXECUTION_MODE") == "mock":
+            results = db.session.query(TestResult).filter_by(test_run_id=run.id).all()
+            ExecutionService._complete_run_mock(run, results)
+            return run
+
+        # Hand pytest execution to the run pool so the caller gets the
+        # queued TestRun back immediately; only ids cross the thread
+        # boundary.  Without a pool (tests, celery workers) run inline.
+        app = current_app._get_current_object()
+        case_ids = [case.id for case in cases]
+        pool = app.extensions.get("run_pool")
+        if pool is None:
+            ExecutionService._execute_run_bg(app, run.id, case_ids)
+        else:
+            pool.submit(ExecutionService._execute_run_bg, app, run.id, case_ids)
+        return run
+
+    @staticmethod
+    def _execute_run_bg(app, run_id, case_ids):
+        """Execute a queued run inside its own app context.
+
+        Re-fetches the rows by id with this context's session; failures
+        are recorded on the run instead of propagating into the pool.
+        """
+        with app.app_context():
+            try:
+                run = db.session.get(TestRun, run_id)
+                run.status = "running"
+                db.session.commit()
+                cases = db.session.query(TestCase).filter(TestCase.id.in_(case_ids)).all()
+                results = db.session.query(TestResult).filter_by(test_run_id=run_id).all()
+                ExecutionService._run_with_pytest(run, cases, results)
+            except Exception:  # noqa: BLE001 - surfaced via run status
+                db.session.rollback()
+                run = db.session.get(TestRun, run_id)
+                if run is not None:
+                    run.status = "error"
+                    run.finished_at = datetime.utcnow()
+                    db.session.commit()
+
+    @staticmethod
+    def _complete_run_mock(run, results):
+        # One executemany UPDATE instead of dirtying each tracked object.
+        db.session.bulk_update_mappings(
+            TestResult,
+            [{"id": r.id, "status": "passed", "duration_seconds": 0.0} for r in results],
+        )
+        run.status = "completed"
+        run.passed = len(results)
+        run.finished_at = datetime.utcnow()
+        db.session.commit()
+
+    @staticmethod
+    def _run_with_pytest(run, cases, results):
+        """Execute the version's scripts in-process and record per-case results.
+
+        pytest runs via pytest.main (no interpreter/plugin startup per
+        run) and fans out across cores with xdist when available.  Each
+        TestResult gets its own status/duration/error from the junit
+        report, matched by test function name, instead of the old
+        uniform pass/fail derived from the exit code.
+        """
+        import pytest
+
+        # Re-select the cases with their scripts eagerly loaded: the
+        # commit in trigger_run expired any previously loaded state, and
+        # selectinload batches the collection into one extra query
+        # (relationships are lazy="raise", so traversal must opt in).
+        cases = (
+            db.session.query(TestCase)
+            .options(selectinload(TestCase.scripts))
+            .filter(TestCase.id.in_([c.id for c in cases]))
+            .all()
+        )
+        with tempfile.TemporaryDirectory(prefix=f"run-{run.id}-") as tmpdir:
+            func_by_case = {}
+            for case in cases:
+                for script in case.scripts:
+                    if not script.is_active:
+                        continue
+                    with open(os.path.join(tmpdir, script.filename), "w", encoding="utf-8") as f:
+                        f.write(script.code)
+                    func_by_case[case.id] = os.path.splitext(script.filename)[0]
+
+            junit_path = os.path.join(tmpdir, "junit.xml")
+            args = [tmpdir, "-q", "-p", "no:cacheprovider", f"--junitxml={junit_path}"]
+            if importlib.util.find_spec("xdist") is not None:
+                args += ["-n", "auto"]
+            pytest.main(args)
+
+            outcomes = _parse_junit(junit_path)
+            passed = failed = skipped = 0
+            for result in results:
+                outcome = outcomes.get(func_by_case.get(result.test_case_id, ""))
+                if outcome is None:
+                    result.status = "skipped"
+                    result.error_message = "No pytest result recorded for this case"
+                    skipped += 1
+                    continue
+                result.status, result.duration_seconds, result.error_message = outcome
+                if result.status == "passed":
+                    passed += 1
+                elif result.status == "skipped":
+                    skipped += 1
+                else:
+                    failed += 1
+            run.status = "completed"
+            run.passed = passed
+            run.failed = failed
+            run.skipped = skipped
+            run.finished_at = datetime.utcnow()
+            db.session.commit()
+
+    @staticmethod
+    def get_run(run_id):
+        run = db.session.get(TestRun, run_id)
+        if run is None:
+            raise ApiError(code=404, status="not_found", message="Run not found")
+        return run
+
+
+class ResultsService:
+    """Query and export run results."""
+
+    @staticmethod
+    def get_run_results(run_id):
+        ExecutionService.get_run(run_id)
+        return db.session.query(TestResult).filter_by(test_run_id=run_id).all()
+
+    @staticmethod
+    def export_results_csv(run_id):
+        """Return ``(filename, bytes)`` for a run's results as CSV.
+
+        Uses the C-implemented csv module (which also quotes embedded
+        commas/newlines correctly) and a column-only query, so no ORM
+        objects are hydrated for the export.
+        """
+        ExecutionService.get_run(run_id)
+        rows = db.session.query(
+            TestResult.id,
+            TestResult.test_case_id,
+            TestResult.status,
+            TestResult.duration_seconds,
+            TestResult.error_message,
+        ).filter_by(test_run_id=run_id)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(["id", "test_case_id", "status", "duration_seconds", "error_message"])
+        writer.writerows(
+            (
+                r.id,
+                r.test_case_id or "",
+                r.status,
+                # duration 0.0 is a real measurement, not a missing value
+                "" if r.duration_seconds is None else r.duration_seconds,
+                r.error_message or "",
+            )
+            for r in rows
+        )
+        return f"results-{run_id}.csv", buf.getvalue().encode("utf-8")
+
+    @staticmethod
+    def export_scripts_zip(srs_version_id):
+        """Build the version's script archive in a spooled temp file.
+
+        Returns ``(filename, fileobj)`` with the file positioned at 0 so
+        the route can hand it straight to ``send_file``; the archive
+        spills to disk past 32 MB instead of growing the heap.
+        """
+        scripts = (
+            db.session.query(TestScript.filename, TestScript.code)
+            .join(TestCase, TestScript.test_case_id == TestCase.id)
+            .filter(
+                TestCase.srs_version_id == srs_version_id,
+                TestCase.is_active.is_(True),
+                TestScript.is_active.is_(True),
+            )
+            .yield_per(200)
+        )
+        tmp = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+        written = write_zip_to_stream(scripts, tmp)
+        if not written:
+            tmp.close()
+            raise ApiError(code=404, status="not_found", message="No scripts for this version")
+        tmp.seek(0)
+        return f"scripts-{srs_version_id}.zip", tmp
@@ -0,0 +1,193 @@
+"""Filesystem storage for jobs, runs, reports and artifacts."""
+
+import functools
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from flask import current_app
+
+from ..utils import safe_join
+
+
+def _write_json_atomic(path, payload):
+    """Serialize ``payload`` with orjson and rename it into place.
+
+    The temp-file + os.replace dance means concurrent readers (e.g.
+    list_runs) never observe a half-written document.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# Shared pool for small metadata reads; threads overlap the file I/O
+# (and orjson releases no GIL worth keeping anyway for these sizes).
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="storage-io")
+
+
+def _read_json(path):
+    """Load a JSON document, returning None when it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_json_cached(path, mtime_ns):
+    """Parse keyed on mtime, so every save invalidates the entry."""
+    return _read_json(path)
+
+
+class Storage:
+    """Thin wrapper over the on-disk layout used by jobs and runs.
+
+    Layout::
+
+        <STORAGE_DIR>/
+            srs/                    uploaded SRS documents
+            jobs/<job_id>/input/    per-job input CSVs
+            jobs/<job_id>/cases.json
+            jobs/<job_id>/tests/    generated pytest files
+            runs/<run_id>/          run metadata, report and artifacts
+    """
+
+    def __init__(self, base_dir=None):
+        if base_dir is None:
+            base_dir = current_app.config["STORAGE_DIR"]
+        self.base_dir = base_dir
+        self.srs_dir = os.path.join(base_dir, "srs")
+        self.jobs_dir = os.path.join(base_dir, "jobs")
+        self.runs_dir = os.path.join(base_dir, "runs")
+        self._ensured = set()
+
+    def _ensure(self, d):
+        """makedirs once per directory; repeat calls are a set lookup."""
+        if d not in self._ensured:
+            os.makedirs(d, exist_ok=True)
+            self._ensured.add(d)
+        return d
+
+    @classmethod
+    def init_app(cls, app):
+        """Create the app's Storage and its base directories at startup.
+
+        Registered from the app factory so the makedirs syscalls happen
+        once per process instead of once per Storage construction.
+        """
+        storage = cls(app.config["STORAGE_DIR"])
+        for d in (storage.base_dir, storage.srs_dir, storage.jobs_dir, storage.runs_dir):
+            storage._ensure(d)
+        app.extensions["storage"] = storage
+        return storage
+
+    @classmethod
+    def instance(cls):
+        """Return the current app's Storage singleton.
+
+        Bound to the app (not the class) so test apps with distinct
+        STORAGE_DIRs never share state.
+        """
+        storage = current_app.extensions.get("storage")
+        if storage is None:
+            storage = cls.init_app(current_app._get_current_object())
+        return storage
+
+    # -- path getters -------------------------------------------------
+
+    def get_job_dir(self, job_id):
+        return self._ensure(os.path.join(self.jobs_dir, job_id))
+
+    def get_job_input_dir(self, job_id):
+        return self._ensure(os.path.join(self.jobs_dir, job_id, "input"))
+
+    def get_job_cases_path(self, job_id):
+        return os.path.join(self.get_job_dir(job_id), "cases.json")
+
+    def get_job_tests_dir(self, job_id):
+        return self._ensure(os.path.join(self.jobs_dir, job_id, "tests"))
+
+    def get_run_dir(self, run_id):
+        return self._ensure(os.path.join(self.runs_dir, run_id))
+
+    def get_run_artifacts_dir(self, run_id):
+        return self._ensure(os.path.join(self.runs_dir, run_id, "artifacts"))
+
+    def safe_join(self, base, *parts):
+        return safe_join(base, *parts)
+
+    # -- metadata persistence -----------------------------------------
+
+    def save_job_metadata(self, job_id, meta):
+        _write_json_atomic(os.path.join(self.get_job_dir(job_id), "job.json"), meta)
+
+    def load_job_metadata(self, job_id):
+        """Load job metadata, reusing the parse while the file is unchanged.
+
+        The job services each re-read this document at their entry
+        point; the mtime-keyed cache collapses those back-to-back reads
+        into one parse.  Returns a copy so callers can mutate and
+        re-save without poisoning the cached document.
+        """
+        path = os.path.join(self.jobs_dir, job_id, "job.json")
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        meta = _read_json_cached(path, mtime_ns)
+        return dict(meta) if meta is not None else None
+
+    def save_run_metadata(self, run_id, meta):
+        _write_json_atomic(os.path.join(self.get_run_dir(run_id), "run.json"), meta)
+
+    def load_run_metadata(self, run_id):
+        return _read_json(os.path.join(self.runs_dir, run_id, "run.json"))
+
+    def save_report(self, run_id, report):
+        _write_json_atomic(os.path.join(self.get_run_dir(run_id), "report.json"), report)
+
+    def save_run_outcome(self, run_id, meta, report):
+        """Persist a finished run's metadata and report concurrently.
+
+        Both documents go through the atomic writer; submitting them to
+        the I/O pool together overlaps the two write+rename sequences
+        instead of paying the disk latency twice back to back.
+        """
+        run_dir = self.get_run_dir(run_id)
+        futures = [
+            _IO_POOL.submit(_write_json_atomic, os.path.join(run_dir, "run.json"), meta),
+            _IO_POOL.submit(_write_json_atomic, os.path.join(run_dir, "report.json"), report),
+        ]
+        for future in futures:
+            future.result()
+
+    def load_report(self, run_id):
+        return _read_json(os.path.join(self.runs_dir, run_id, "report.json"))
+
+    def list_runs(self):
+        """Return summaries of all known runs, oldest first.
+
+        scandir answers is_dir() from the directory entry without a
+        second stat, and the per-run metadata/report reads overlap in
+        the I/O pool instead of serializing two opens per run.
+        """
+        with os.scandir(self.runs_dir) as it:
+            names = sorted(e.name for e in it if e.is_dir())
+        metas = _IO_POOL.map(self.load_run_metadata, names)
+        reports = _IO_POOL.map(self.load_report, names)
+        runs = []
+        for meta, report in zip(metas, reports):
+            if meta is None:
+                continue
+            meta["report"] = report
+            runs.append(meta)
+        return runs
@@ -0,0 +1,210 @@
+"""Filesystem-job pipeline: derive test cases from uploaded SRS CSVs."""
+
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import ijson
+import orjson
+
+from ..errors import ApiError
+from ..utils import dump_json, parse_csv_flex
+from .llm import get_llm
+from .storage import Storage
+
+# Requirements per LLM prompt and concurrent in-flight prompts; batching
+# cuts the call count to N/20 while the pool overlaps the rest.
+_PROMPT_BATCH_SIZE = 20
+_PROMPT_MAX_WORKERS = 8
+
+
+def _batched_prompts(rows, batch_size=_PROMPT_BATCH_SIZE):
+    """Return ``(batch_rows, prompt)`` pairs covering every row.
+
+    Requirements carry a ``[index]`` identifier (1-based within the
+    batch) that the model is asked to echo, so responses can be merged
+    back positionally even when it reorders or drops entries.
+    """
+    prompts = []
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        lines = [
+            "You are generating functional test cases from software requirements.",
+            'Respond with JSON: {"test_cases": [{"index", "requirement_id", "title", '
+            '"description", "steps", "expected"}]}.',
+            "Echo each requirement's [index] number in its test case.",
+            "Requirements:",
+        ]
+        for offset, row in enumerate(batch, start=1):
+            lines.append(
+                f"[{offset}] {row.get('requirement_id', '')}: "
+                f"{row.get('title', '')} — {row.get('description', '')}"
+            )
+        prompts.append((batch, "\n".join(lines)))
+    return prompts
+
+
+def _stream_llm_cases(prompt):
+    """Stream a completion and parse ``test_cases`` items as tokens arrive.
+
+    Feeds chunks from ``llm.stream_text`` into an incremental ijson
+    parser so cases become available before the model finishes decoding.
+    Chunks are also buffered so that malformed or unexpectedly shaped
+    output can be re-parsed with the tolerant buffered path.
+    """
+    buffered = []
+    items = ijson.sendable_list()
+    coro = ijson.items_coro(items, "test_cases.item")
+    cases = []
+    broken = False
+    for chunk in get_llm().stream_text(prompt):
+        buffered.append(chunk)
+        if not broken and chunk:
+            try:
+                coro.send(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            except ijson.JSONError:
+                broken = True
+        if items:
+            cases.extend(c for c in items if isinstance(c, dict))
+            del items[:]
+    if not broken:
+        try:
+            coro.close()
+        except ijson.JSONError:
+            broken = True
+        cases.extend(c for c in items if isinstance(c, dict))
+    if broken or not cases:
+        # Covers bare top-level arrays and invalid JSON alike.
+        return _parse_llm_cases("".join(buffered))
+    return cases
+
+
+def _generate_batch(batch_and_prompt):
+    """Generate one case per row of a batch, falling back per row."""
+    batch, prompt = batch_and_prompt
+    parsed = _stream_llm_cases(prompt)
+    by_index = {}
+    for position, case in enumerate(parsed, start=1):
+        try:
+            index = int(case.pop("index", position))
+        except (TypeError, ValueError):
+            index = position
+        by_index.setdefault(index, case)
+    cases = []
+    for offset, row in enumerate(batch, start=1):
+        case = by_index.get(offset) or _deterministic_from_rows([row])[0]
+        case.setdefault("requirement_id", row.get("requirement_id") or "")
+        cases.append(case)
+    return cases
+
+
+def _parse_llm_cases(text):
+    """Parse an LLM completion into a list of test-case dicts, or []."""
+    if not text:
+        return []
+    try:
+        data = orjson.loads(text)
+    except (orjson.JSONDecodeError, TypeError):
+        return []
+    cases = data.get("test_cases") if isinstance(data, dict) else data
+    if not isinstance(cases, list):
+        return []
+    return [c for c in cases if isinstance(c, dict)]
+
+
+def _deterministic_from_rows(rows):
+    """Fallback: one straightforward test case per requirement row."""
+    cases = []
+    for row in rows:
+        rid = row.get("requirement_id") or ""
+        cases.append(
+            {
+                "requirement_id": rid,
+                "title": f"Verify {row.get('title') or rid}",
+                "description": row.get("description") or "",
+                "steps": ["Review the requirement", "Exercise the behaviour", "Observe the outcome"],
+                "expected": "Behaviour matches the requirement",
+            }
+        )
+    return cases
+
+
+@functools.lru_cache(maxsize=128)
+def _load_cases_cached(cases_path, mtime_ns):
+    """Parse a cases document; keyed on mtime so rewrites invalidate."""
+    with open(cases_path, encoding="utf-8") as f:
+        return json.load(f).get("test_cases") or []
+
+
+def _load_cases(job_id, storage=None):
+    """Load the generated cases list for a job from disk."""
+    storage = storage or Storage.instance()
+    cases_path = storage.get_job_cases_path(job_id)
+    try:
+        stat = os.stat(cases_path)
+    except FileNotFoundError:
+        raise ApiError(code=404, status="not_found", message="No generated cases for this job")
+    return _load_cases_cached(cases_path, stat.st_mtime_ns)
+
+
+def _collect_rows(storage, job_id):
+    """Parse and concatenate all of a job's input CSVs."""
+    input_dir = storage.get_job_input_dir(job_id)
+    with os.scandir(input_dir) as entries:
+        csv_files = [
+            e.name for e in entries if e.is_file() and e.name.lower().endswith(".csv")
+        ]
+    if not csv_files:
+        raise ApiError(code=400, status="bad_request", message="Job has no input CSV files")
+    rows = []
+    for name in sorted(csv_files):
+        rows.extend(parse_csv_flex(storage.safe_join(input_dir, name)))
+    return rows
+
+
+# Below this many rows the deterministic cases match LLM quality and
+# the network round-trip dominates end-to-end latency.
+_LLM_MIN_ROWS = 3
+
+
+def _generate_cases(rows):
+    """Produce one test case per row via batched, concurrent prompting.
+
+    Trivial inputs — and deployments with ``LLM_DISABLE`` set — skip
+    the LLM entirely and take the deterministic path.
+    """
+    if os.getenv("LLM_DISABLE") or len(rows) < _LLM_MIN_ROWS:
+        return _deterministic_from_rows(rows)
+    prompts = _batched_prompts(rows)
+    if len(prompts) <= 1:
+        return [case for pair in prompts for case in _generate_batch(pair)]
+    with ThreadPoolExecutor(max_workers=min(_PROMPT_MAX_WORKERS, len(prompts))) as pool:
+        return [case for batch in pool.map(_generate_batch, prompts) for case in batch]
+
+
+def _persist_cases(storage, job_id, cases):
+    """Write the cases document for a job."""
+    payload = {
+        "job_id": job_id,
+        "generated_at": datetime.utcnow().isoformat(),
+        "test_cases": cases,
+    }
+    dump_json(storage.get_job_cases_path(job_id), payload)
+
+
+def generate_test_cases_for_job(job_id):
+    """Generate (or regenerate) test cases for a job's uploaded CSVs."""
+    storage = Storage.instance()
+    meta = storage.load_job_metadata(job_id)
+    if meta is None:
+        raise ApiError(code=404, status="not_found", message="Job not found")
+
+    cases = _generate_cases(_collect_rows(storage, job_id))
+    _persist_cases(storage, job_id, cases)
+
+    meta["status"] = "cases_generated"
+    meta["case_count"] = len(cases)
+    storage.save_job_metadata(job_id, meta)
+    return cases
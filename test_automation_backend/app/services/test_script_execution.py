@@ -0,0 +1,180 @@
+"""Filesystem-job pipeline: render pytest files and execute them."""
+
+import importlib.util
+import os
+import string
+import subprocess
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:  # lxml's C iterparse is several times faster on big junit files
+    from lxml import etree as _XML
+except ImportError:
+    from defusedxml import ElementTree as _XML
+
+from ..errors import ApiError
+from ..utils import dump_json, generate_id, sanitize_identifier
+from .storage import Storage
+from .test_case_creation import _load_cases
+
+
+# Prebuilt templates: the parse happens once at import instead of
+# re-assembling line lists per requirement bucket.
+_FILE_HEADER = string.Template('"""\nAuto-generated tests for requirement $rid.\n"""\n\n')
+_CASE_TEMPLATE = string.Template(
+    "def test_$fn():\n"
+    '    """$title"""\n'
+    "    steps = $steps\n"
+    "    expected = $expected\n"
+    "    assert isinstance(steps, list)\n\n"
+)
+
+
+def _render_test_file(requirement_id, cases):
+    """Render one pytest file covering all cases for a requirement."""
+    parts = [_FILE_HEADER.substitute(rid=requirement_id)]
+    for case in cases:
+        fn = sanitize_identifier(f"{requirement_id}_{case.get('title', '')}").replace("-", "_")
+        parts.append(
+            _CASE_TEMPLATE.substitute(
+                fn=fn,
+                title=(case.get("title") or "").replace('"', "'"),
+                steps=repr(case.get("steps") or []),
+                expected=repr(case.get("expected") or ""),
+            )
+        )
+    return "".join(parts)
+
+
+# Concurrent per-bucket file writes; beyond this the threads mostly
+# contend on the same disk.
+_WRITE_MAX_WORKERS = 8
+
+
+def _render_and_write(tests_dir, rid, group):
+    """Render one bucket's pytest file to disk; returns the filename."""
+    filename = f"test_{sanitize_identifier(rid)}.py"
+    with open(os.path.join(tests_dir, filename), "w", encoding="utf-8") as f:
+        f.write(_render_test_file(rid, group))
+    return filename
+
+
+def _write_script_files(storage, job_id, cases):
+    """Render one pytest file per requirement bucket and record them."""
+    buckets = defaultdict(list)
+    for case in cases:
+        buckets[case.get("requirement_id") or "misc"].append(case)
+
+    tests_dir = storage.get_job_tests_dir(job_id)
+    if len(buckets) <= 1:
+        written_files = [_render_and_write(tests_dir, rid, g) for rid, g in buckets.items()]
+    else:
+        # Overlap the filesystem latency of the per-bucket writes.
+        with ThreadPoolExecutor(max_workers=min(_WRITE_MAX_WORKERS, len(buckets))) as pool:
+            futures = [pool.submit(_render_and_write, tests_dir, rid, g) for rid, g in buckets.items()]
+            written_files = [f.result() for f in futures]
+
+    scripts_meta = {
+        "job_id": job_id,
+        "generated_at": datetime.utcnow().isoformat(),
+        "files": written_files,
+    }
+    dump_json(os.path.join(storage.get_job_dir(job_id), "scripts.json"), scripts_meta)
+    return written_files
+
+
+def generate_test_scripts_for_job(job_id):
+    """Write one pytest file per requirement bucket for a job's cases."""
+    storage = Storage.instance()
+    meta = storage.load_job_metadata(job_id)
+    if meta is None:
+        raise ApiError(code=404, status="not_found", message="Job not found")
+
+    written_files = _write_script_files(storage, job_id, _load_cases(job_id, storage))
+
+    meta["status"] = "scripts_generated"
+    meta["script_count"] = len(written_files)
+    storage.save_job_metadata(job_id, meta)
+    return written_files
+
+
+def _aggregate_pytest_output(junit_xml_path):
+    """Summarize a pytest run from its junit.xml output.
+
+    Tallies element tags in a single streaming ``iterparse`` pass.
+    Clearing each element as it closes releases its text, attributes
+    and subtree right away, so memory tracks the element count rather
+    than the document size, and substrings inside text nodes (e.g.
+    ``<testcase`` in a failure message) can't skew the counts.
+    """
+    counts = Counter()
+    if os.path.exists(junit_xml_path):
+        for _event, elem in _XML.iterparse(junit_xml_path, events=("end",)):
+            counts[elem.tag] += 1
+            elem.clear()
+    total = counts["testcase"]
+    failed = counts["failure"]
+    errors = counts["error"]
+    skipped = counts["skipped"]
+    passed = max(total - failed - errors - skipped, 0)
+    return {
+        "total": total,
+        "passed": passed,
+        "failed": failed + errors,
+        "skipped": skipped,
+    }
+
+
+def execute_tests_for_job(job_id):
+    """Run the generated pytest files for a job and persist a report."""
+    storage = Storage.instance()
+    meta = storage.load_job_metadata(job_id)
+    if meta is None:
+        raise ApiError(code=404, status="not_found", message="Job not found")
+
+    tests_dir = storage.get_job_tests_dir(job_id)
+    run_id = generate_id("run-")
+    run_dir = storage.get_run_dir(run_id)
+    artifacts_dir = storage.get_run_artifacts_dir(run_id)
+    junit_xml_path = os.path.join(artifacts_dir, "junit.xml")
+
+    started_at = datetime.utcnow().isoformat()
+    storage.save_run_metadata(
+        run_id,
+        {"id": run_id, "job_id": job_id, "status": "running", "started_at": started_at},
+    )
+
+    cmd = ["pytest", tests_dir, "-q", f"--junitxml={junit_xml_path}"]
+    if importlib.util.find_spec("xdist") is not None:
+        # One file per requirement bucket; loadfile keeps each bucket on
+        # a single worker while the buckets run in parallel.
+        cmd += ["-n", str(os.cpu_count() or 2), "--dist=loadfile"]
+    # Point the subprocess at the artifact files directly; output goes
+    # to disk as pytest produces it instead of being buffered in RAM
+    # and copied out afterwards.
+    stdout_path = os.path.join(artifacts_dir, "stdout.txt")
+    stderr_path = os.path.join(artifacts_dir, "stderr.txt")
+    with open(stdout_path, "wb") as out, open(stderr_path, "wb") as err:
+        proc = subprocess.Popen(cmd, stdout=out, stderr=err)
+        try:
+            proc.wait(timeout=300)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    summary = _aggregate_pytest_output(junit_xml_path)
+    finished_at = datetime.utcnow().isoformat()
+    report = dict(summary, run_id=run_id, generated_at=finished_at)
+    storage.save_run_outcome(
+        run_id,
+        {
+            "id": run_id,
+            "job_id": job_id,
+            "status": "completed" if proc.returncode in (0, 1) else "error",
+            "started_at": started_at,
+            "finished_at": finished_at,
+        },
+        report,
+    )
+    return run_id, report
@@ -0,0 +1,123 @@
+"""Background job dispatch for generation and execution work.
+
+LLM calls and pytest runs can hold a request thread for minutes, so the
+routes queue them here and answer immediately with a job id that clients
+poll via ``/api/jobs/<id>``.  Dispatch picks the best available backend:
+a Celery worker when :mod:`app.celery_app` produced one, otherwise a
+small in-process thread pool.  Under ``TESTING`` the task runs eagerly
+in the request thread (the same switch celery's ``task_always_eager``
+flips), so tests see completed jobs without polling.
+
+Progress is recorded through ``Storage.save_job_metadata`` in both
+modes, so the polling endpoint needs no knowledge of the backend.
+"""
+
+from datetime import datetime
+
+from flask import current_app
+
+from .extensions import db
+from .utils import generate_id
+
+
+def _update_job(storage, job_id, **changes):
+    meta = storage.load_job_metadata(job_id) or {"id": job_id}
+    meta.update(changes)
+    storage.save_job_metadata(job_id, meta)
+
+
+def _make_runner(work):
+    """Wrap a service call with job status bookkeeping.
+
+    Runners execute inside an app context (Celery's task class or the
+    thread-pool wrapper provides it) and never raise: failures roll the
+    session back and land in the job metadata for the poller.
+    """
+
+    def runner(job_id, version_id, **kwargs):
+        storage = current_app.extensions["storage"]
+        _update_job(storage, job_id, status="running")
+        try:
+            result = work(version_id, **kwargs)
+        except Exception as err:  # noqa: BLE001 - reported via job status
+            db.session.rollback()
+            message = getattr(err, "message", None) or str(err)
+            _update_job(
+                storage,
+                job_id,
+                status="failed",
+                error=message,
+                finished_at=datetime.utcnow().isoformat(),
+            )
+        else:
+            _update_job(
+                storage,
+                job_id,
+                status="completed",
+                result=result,
+                finished_at=datetime.utcnow().isoformat(),
+            )
+
+    return runner
+
+
+def _generate_cases(version_id):
+    from .services.services import GenerationService
+
+    cases = GenerationService.generate_test_cases_for_version(version_id)
+    return {"caseCount": len(cases)}
+
+
+def _generate_scripts(version_id):
+    from .services.services import GenerationService
+
+    scripts = GenerationService.generate_scripts_for_version(version_id)
+    return {"generated": len(scripts)}
+
+
+def _execute_run(version_id, triggered_by=None):
+    from .services.services import ExecutionService
+
+    run = ExecutionService.trigger_run(version_id, triggered_by=triggered_by)
+    return {"runId": run.id, "status": run.status}
+
+
+TASK_RUNNERS = {
+    "generate_cases": _make_runner(_generate_cases),
+    "generate_scripts": _make_runner(_generate_scripts),
+    "execute_run": _make_runner(_execute_run),
+}
+
+
+def submit(kind, version_id, **kwargs):
+    """Queue a background task and return its pollable job id."""
+    app = current_app._get_current_object()
+    storage = app.extensions["storage"]
+    runner = TASK_RUNNERS[kind]
+
+    job_id = generate_id("job-")
+    storage.save_job_metadata(
+        job_id,
+        {
+            "id": job_id,
+            "kind": kind,
+            "version_id": version_id,
+            "status": "queued",
+            "created_at": datetime.utcnow().isoformat(),
+        },
+    )
+
+    celery = app.extensions.get("celery")
+    if celery is not None:
+        celery.send_task(f"app.tasks.{kind}", args=[job_id, version_id], kwargs=kwargs)
+    elif app.config.get("TESTING"):
+        runner(job_id, version_id, **kwargs)
+    else:
+        pool = app.extensions["task_pool"]
+
+        def call():
+            with app.app_context():
+                runner(job_id, version_id, **kwargs)
+
+        pool.submit(call)
+    return job_id
@@ -0,0 +1,276 @@
+"""Small shared helpers: ids, CSV validation and ZIP packing."""
+
+import codecs
+import csv
+import hashlib
+import io
+import os
+import secrets
+import zipfile
+
+import orjson
+
+REQUIRED_SRS_COLUMNS = ["requirement_id", "title", "description"]
+
+
+def generate_id(prefix=""):
+    """Return a short unique identifier, optionally prefixed.
+
+    ``token_hex(6)`` draws exactly the 6 random bytes the 12-char id
+    needs, instead of building a full UUID and discarding most of it.
+    """
+    return f"{prefix}{secrets.token_hex(6)}"
+
+
+def dump_json(path, obj):
+    """Serialize ``obj`` as indented JSON to ``path`` via orjson."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def sha256_path(path):
+    """Hex SHA-256 of a file, streamed in fixed-size buffers.
+
+    ``hashlib.file_digest`` reads through a 64 KiB buffer and dispatches
+    to OpenSSL's accelerated SHA implementation, so memory stays
+    constant regardless of file size.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class _SanitizeTable(dict):
+    """Translation table: alnum lower-cased, '-'/'_' kept, rest → '_'.
+
+    Entries for characters outside the pre-seeded ASCII range are
+    computed on first sight and cached, so repeated inputs stay on
+    ``str.translate``'s C fast path.
+    """
+
+    def __missing__(self, code):
+        ch = chr(code)
+        mapped = ch.lower() if ch.isalnum() else "_"
+        self[code] = mapped
+        return mapped
+
+
+_SANITIZE_TABLE = _SanitizeTable(
+    {code: chr(code).lower() if chr(code).isalnum() else "_" for code in range(128)}
+)
+_SANITIZE_TABLE[ord("-")] = "-"
+_SANITIZE_TABLE[ord("_")] = "_"
+
+
+def sanitize_identifier(text):
+    """Lower-case ``text`` and replace anything outside [a-z0-9_-] with '_'."""
+    result = (text or "").translate(_SANITIZE_TABLE).strip("_")
+    return result or "item"
+
+
+def validate_srs_csv(text):
+    """Validate an SRS CSV document.
+
+    Returns ``(rows, errors)`` where ``rows`` is a list of dicts with
+    normalized (stripped, lower-cased) keys and ``errors`` a list of
+    human-readable problems.  The required columns are
+    ``requirement_id``, ``title`` and ``description``.
+    """
+    rows = []
+    errors = []
+    reader = csv.reader(io.StringIO(text))
+    try:
+        raw_header = next(reader)
+    except StopIteration:
+        return rows, ["CSV file is empty"]
+    # Normalize the header once; rows then reuse it via zip instead of
+    # re-stripping keys and rebuilding lookups per row.
+    header = [(h or "").strip().lower() for h in raw_header]
+    for col in REQUIRED_SRS_COLUMNS:
+        if col not in header:
+            errors.append(f"Missing required column: {col}")
+    if errors:
+        return rows, errors
+    required_idx = [(header.index(col), col) for col in REQUIRED_SRS_COLUMNS]
+    width = len(header)
+    for lineno, row in enumerate(reader, start=2):
+        if not row:  # blank line; DictReader skipped these too
+            continue
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        stripped = [(v or "").strip() for v in row[:width]]
+        for j, col in required_idx:
+            if not stripped[j]:
+                errors.append(f"Row {lineno}: missing value for '{col}'")
+        rows.append(dict(zip(header, stripped)))
+    return rows, errors
+
+
+class StreamingSRSValidator:
+    """Validate an SRS CSV incrementally as byte chunks arrive.
+
+    Feed upload chunks with :meth:`feed` while they are being hashed and
+    written to disk, then call :meth:`close` for ``(rows, errors)`` in
+    the same shape :func:`validate_srs_csv` returns.  Only ``O(record)``
+    text is buffered, so arbitrarily large uploads validate in constant
+    memory.  Records are split on newlines outside quoted fields, which
+    keeps embedded newlines in quoted values intact.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._pending = ""
+        self._scan_from = 0
+        self._open_quotes = False
+        self._header = None
+        self._header_errors = []
+        self._lineno = 1
+        self.rows = []
+        self.errors = []
+
+    def feed(self, chunk):
+        self._consume(self._decoder.decode(chunk))
+
+    def close(self):
+        """Flush the decoder and return ``(rows, errors)``."""
+        self._consume(self._decoder.decode(b"", True))
+        if self._pending.strip():
+            self._handle_record(self._pending)
+            self._pending = ""
+        if self._header is None:
+            return self.rows, ["CSV file is empty"]
+        if self._header_errors:
+            return self.rows, self._header_errors
+        return self.rows, self.errors
+
+    def _consume(self, text):
+        if not text:
+            return
+        self._pending += text
+        start = 0
+        for i in range(self._scan_from, len(self._pending)):
+            ch = self._pending[i]
+            if ch == '"':
+                self._open_quotes = not self._open_quotes
+            elif ch == "\n" and not self._open_quotes:
+                self._handle_record(self._pending[start:i])
+                start = i + 1
+        self._pending = self._pending[start:]
+        self._scan_from = len(self._pending)
+
+    def _handle_record(self, record):
+        record = record.rstrip("\r")
+        if not record.strip():
+            return
+        fields = next(csv.reader([record]))
+        if self._header is None:
+            self._header = [(h or "").strip().lower() for h in fields]
+            for col in REQUIRED_SRS_COLUMNS:
+                if col not in self._header:
+                    self._header_errors.append(f"Missing required column: {col}")
+            self._lineno = 2
+            return
+        if self._header_errors:
+            return
+        normalized = {
+            key: (fields[i].strip() if i < len(fields) else "")
+            for i, key in enumerate(self._header)
+        }
+        for col in REQUIRED_SRS_COLUMNS:
+            if not normalized.get(col):
+                self.errors.append(f"Row {self._lineno}: missing value for '{col}'")
+        self.rows.append(normalized)
+        self._lineno += 1
+
+
+try:  # optional, C++-accelerated CSV parsing for large files
+    import pyarrow as _pa
+    import pyarrow.csv as _pacsv
+except ImportError:
+    _pa = _pacsv = None
+
+
+def _parse_csv_arrow(path):
+    """pyarrow path for :func:`parse_csv_flex`.
+
+    Every column is declared as string up front — type inference would
+    otherwise rewrite values ("001" → 1, "true" → True, dates to their
+    repr) and silently change generated case content.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        try:
+            raw_header = next(csv.reader(f))
+        except StopIteration:
+            return []
+    table = _pacsv.read_csv(
+        path,
+        # Reuse the header we already read so the declared column types
+        # key on exactly the names pyarrow will use.
+        read_options=_pacsv.ReadOptions(column_names=raw_header, skip_rows=1),
+        convert_options=_pacsv.ConvertOptions(
+            column_types={name: _pa.string() for name in raw_header},
+            strings_can_be_null=True,
+        ),
+    )
+    table = table.rename_columns([(c or "").strip().lower() for c in table.column_names])
+    return [
+        {k: ("" if v is None else v.strip()) for k, v in row.items()}
+        for row in table.to_pylist()
+    ]
+
+
+def parse_csv_flex(path):
+    """Parse a CSV file into a list of dicts with normalized keys.
+
+    Uses pyarrow's native CSV reader when available — roughly an order
+    of magnitude faster than DictReader on large files — and falls back
+    to the stdlib otherwise.  Either way the result is the same: one
+    dict per row with stripped, lower-cased keys and stripped string
+    values.
+    """
+    if _pacsv is not None:
+        try:
+            return _parse_csv_arrow(path)
+        except _pa.ArrowInvalid:
+            pass  # too malformed for arrow's strict reader; stdlib is more lenient
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        return [
+            {
+                (k or "").strip().lower(): (v or "").strip()
+                for k, v in row.items()
+                if k is not None  # restkey: extra fields beyond the header
+            }
+            for row in reader
+        ]
+
+
+def write_zip_to_stream(files, out):
+    """Write ``(arcname, data)`` pairs as a ZIP archive onto ``out``.
+
+    Entries are compressed straight onto the stream (a response, spooled
+    temp file, ...), so peak memory is one entry rather than the whole
+    archive.  ``files`` may be any iterable; returns the number of
+    entries written.  compresslevel 1 keeps deflate fast — the higher
+    levels are compute-bound and buy little on short text artifacts.
+    """
+    written = 0
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for name, data in files:
+            zf.writestr(name, data)
+            written += 1
+    return written
+
+
+def write_zip_from_files(files):
+    """Pack ``[(arcname, bytes), ...]`` into a ZIP archive and return its bytes."""
+    buf = io.BytesIO()
+    write_zip_to_stream(files, buf)
+    return buf.getvalue()
+
+
+def safe_join(base, *parts):
+    """Join ``parts`` onto ``base`` refusing paths that escape ``base``."""
+    candidate = os.path.abspath(os.path.join(base, *parts))
+    if not candidate.startswith(os.path.abspath(base) + os.sep):
+        raise ValueError("Path escapes storage root")
+    return candidate
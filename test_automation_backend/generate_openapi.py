@@ -0,0 +1,19 @@
+"""Dump the OpenAPI spec to interfaces/openapi.json."""
+
+import os
+
+from app import create_app
+from app.utils import dump_json
+
+
+def main():
+    app = create_app()
+    client = app.test_client()
+    spec = client.get("/docs/openapi.json").get_json()
+    out_dir = os.path.join(os.path.dirname(__file__), "interfaces")
+    os.makedirs(out_dir, exist_ok=True)
+    dump_json(os.path.join(out_dir, "openapi.json"), spec)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Alembic environment for the test automation backend."""
+
+import os
+
+from alembic import context
+from sqlalchemy import create_engine
+
+
+def _database_url():
+    return os.getenv(
+        "DATABASE_URL", "sqlite:///" + os.path.join(os.getcwd(), "test_automation.db")
+    )
+
+
+def run_migrations_offline():
+    context.configure(url=_database_url(), literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    engine = create_engine(_database_url())
+    with engine.connect() as connection:
+        context.configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,134 @@
+"""Initial schema.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-11-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _build_metadata():
+    """Describe the full initial schema on one MetaData object.
+
+    Emitting it with ``create_all`` batches the DDL through a single
+    bind instead of one ``op.create_table``/``op.create_index``
+    round-trip per object; index definitions live alongside their
+    tables so they are part of the same pass.
+    """
+    metadata = sa.MetaData()
+    sa.Table(
+        "srs",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("uploaded_by", sa.String(255)),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    sa.Table(
+        "srs_versions",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("srs_id", sa.String(36), sa.ForeignKey("srs.id"), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("file_hash", sa.String(64), nullable=False),
+        sa.Column("storage_path", sa.String(512), nullable=False),
+        sa.Column("notes", sa.Text()),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_srsversion_srs", "srs_id"),
+    )
+    sa.Table(
+        "test_cases",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("srs_version_id", sa.String(36), sa.ForeignKey("srs_versions.id"), nullable=False),
+        sa.Column("requirement_id", sa.String(64), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("priority", sa.String(16)),
+        sa.Column("status", sa.String(32), nullable=False, server_default="draft"),
+        sa.Column("metadata", sa.JSON()),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_testcase_status", "status"),
+        sa.Index("ix_testcase_requirement", "requirement_id"),
+        sa.Index("ix_testcase_srsver", "srs_version_id"),
+        sa.Index("ix_testcase_srsver_status", "srs_version_id", "status"),
+    )
+    sa.Table(
+        "test_scripts",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("test_case_id", sa.String(36), sa.ForeignKey("test_cases.id"), nullable=False),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("code", sa.Text(), nullable=False),
+        sa.Column("language", sa.String(32), nullable=False, server_default="python"),
+        sa.Column("framework", sa.String(32), nullable=False, server_default="pytest-playwright"),
+        sa.Column("gen_metadata", sa.JSON()),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_testscript_case", "test_case_id"),
+    )
+    sa.Table(
+        "test_runs",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("srs_version_id", sa.String(36), sa.ForeignKey("srs_versions.id"), nullable=False),
+        sa.Column("status", sa.String(32), nullable=False, server_default="pending"),
+        sa.Column("triggered_by", sa.String(255)),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("finished_at", sa.DateTime()),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("passed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_testrun_srsver", "srs_version_id"),
+    )
+    sa.Table(
+        "test_results",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("test_run_id", sa.String(36), sa.ForeignKey("test_runs.id"), nullable=False),
+        sa.Column("test_case_id", sa.String(36), sa.ForeignKey("test_cases.id")),
+        sa.Column("status", sa.String(32), nullable=False, server_default="pending"),
+        sa.Column("duration_seconds", sa.Float()),
+        sa.Column("error_message", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_testresult_status", "status"),
+        sa.Index("ix_testresult_run", "test_run_id"),
+        sa.Index("ix_testresult_run_status", "test_run_id", "status"),
+    )
+    sa.Table(
+        "artifacts",
+        metadata,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("test_run_id", sa.String(36), sa.ForeignKey("test_runs.id"), nullable=False),
+        sa.Column("script_id", sa.String(36), sa.ForeignKey("test_scripts.id")),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("path", sa.String(512), nullable=False),
+        sa.Column("metadata", sa.JSON()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Index("ix_artifact_kind", "kind"),
+        sa.Index("ix_artifact_run", "test_run_id"),
+        sa.Index("ix_artifact_run_kind", "test_run_id", "kind"),
+        sa.Index("ix_artifact_script_kind", "script_id", "kind"),
+    )
+    return metadata
+
+
+def upgrade():
+    _build_metadata().create_all(op.get_bind(), checkfirst=False)
+
+
+def downgrade():
+    _build_metadata().drop_all(op.get_bind(), checkfirst=False)
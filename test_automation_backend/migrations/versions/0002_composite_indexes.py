@@ -0,0 +1,42 @@
+"""Composite indexes for hot filter paths.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-09-01
+
+These indexes are part of the initial schema as of revision 0001, so
+fresh installs already have them; this revision backfills databases
+created before they were folded in.  Creation and removal are guarded
+by an inspector check to stay idempotent either way.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_testresult_run_status", "test_results", ["test_run_id", "status"]),
+    ("ix_testcase_srsver_status", "test_cases", ["srs_version_id", "status"]),
+    ("ix_artifact_run_kind", "artifacts", ["test_run_id", "kind"]),
+    ("ix_artifact_script_kind", "artifacts", ["script_id", "kind"]),
+]
+
+
+def _existing(table):
+    inspector = sa.inspect(op.get_bind())
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def upgrade():
+    for name, table, columns in _INDEXES:
+        if name not in _existing(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _columns in reversed(_INDEXES):
+        if name in _existing(table):
+            op.drop_index(name, table_name=table)
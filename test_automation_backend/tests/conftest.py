@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.fixture()
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("STORAGE_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+
+    from app import create_app
+    from app.config import BaseConfig
+    from app.extensions import db
+
+    class TestConfig(BaseConfig):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = "sqlite://"
+        STORAGE_DIR = str(tmp_path / "storage")
+        EXECUTION_MODE = "mock"
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        from app import models  # noqa: F401
+
+        db.create_all()
+    yield app
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
@@ -0,0 +1,35 @@
+"""Factory sanity checks guarding against double module load.
+
+The tree previously carried two concatenated copies of the app factory,
+which registered every blueprint (and CORS) twice.  These tests pin the
+consolidated behaviour: one factory, one registration per endpoint.
+"""
+
+from collections import Counter
+
+
+def test_health_endpoint(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.get_json() == {"message": "Healthy"}
+
+
+def test_no_duplicate_url_rules(app):
+    rules = [str(rule) + "|" + rule.endpoint for rule in app.url_map.iter_rules()]
+    duplicated = [rule for rule, count in Counter(rules).items() if count > 1]
+    assert duplicated == []
+
+
+def test_factory_is_idempotent(app, tmp_path):
+    # Creating a second app from the factory must yield the same rule count,
+    # i.e. module state is not mutated by the first instantiation.
+    from app import create_app
+    from app.config import BaseConfig
+
+    class Cfg(BaseConfig):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = "sqlite://"
+        STORAGE_DIR = str(tmp_path / "storage2")
+
+    second = create_app(Cfg)
+    assert len(list(second.url_map.iter_rules())) == len(list(app.url_map.iter_rules()))
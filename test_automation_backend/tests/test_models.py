@@ -0,0 +1,52 @@
+"""Model loading-policy checks."""
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+
+def _seed_run(db):
+    from app.models import SRS, SRSVersion, TestResult, TestRun
+
+    srs = SRS(name="s")
+    db.session.add(srs)
+    db.session.flush()
+    version = SRSVersion(srs_id=srs.id, filename="f.csv", file_hash="h", storage_path="/tmp/f.csv")
+    db.session.add(version)
+    db.session.flush()
+    run = TestRun(srs_version_id=version.id, total=1)
+    db.session.add(run)
+    db.session.flush()
+    db.session.add(TestResult(test_run_id=run.id, status="passed"))
+    db.session.commit()
+    return run.id
+
+
+def test_implicit_relationship_access_raises(app):
+    # Relationships default to lazy="raise": touching one without an
+    # explicit loader option must fail loudly instead of issuing a
+    # hidden per-row query.
+    from app.extensions import db
+    from app.models import TestRun
+
+    with app.app_context():
+        run_id = _seed_run(db)
+        db.session.expire_all()
+        run = db.session.get(TestRun, run_id)
+        with pytest.raises(InvalidRequestError):
+            list(run.results)
+
+
+def test_explicit_selectinload_still_works(app):
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.extensions import db
+    from app.models import TestRun
+
+    with app.app_context():
+        run_id = _seed_run(db)
+        db.session.expire_all()
+        run = db.session.execute(
+            select(TestRun).options(selectinload(TestRun.results)).where(TestRun.id == run_id)
+        ).scalar_one()
+        assert [r.status for r in run.results] == ["passed"]
@@ -0,0 +1,46 @@
+"""Tests for the CSV parsing helpers in app.utils."""
+
+import importlib.util
+
+import pytest
+
+from app.utils import parse_csv_flex
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / "input.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_parse_csv_flex_normalizes_keys_and_values(tmp_path):
+    path = _write_csv(tmp_path, "Requirement_ID , title,description\n R1 , Login ,d\n")
+    assert parse_csv_flex(path) == [
+        {"requirement_id": "R1", "title": "Login", "description": "d"}
+    ]
+
+
+def test_parse_csv_flex_tolerates_extra_trailing_field(tmp_path):
+    # A stray trailing comma must not crash the parse.
+    path = _write_csv(tmp_path, "requirement_id,title,description\nR1,Login,d,\n")
+    assert parse_csv_flex(path) == [
+        {"requirement_id": "R1", "title": "Login", "description": "d"}
+    ]
+
+
+def test_parse_csv_flex_empty_file(tmp_path):
+    assert parse_csv_flex(_write_csv(tmp_path, "")) == []
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"
+)
+def test_parse_csv_flex_pyarrow_keeps_values_as_strings(tmp_path):
+    # Type inference must not rewrite ids, booleans or dates.
+    path = _write_csv(
+        tmp_path,
+        "requirement_id,title,description\n001,true,2024-01-02\n",
+    )
+    assert parse_csv_flex(path) == [
+        {"requirement_id": "001", "title": "true", "description": "2024-01-02"}
+    ]